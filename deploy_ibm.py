@@ -83,8 +83,9 @@ def main() -> int:
         print("Phase 1 Complete! Source code uploaded to COS.")
         print("=" * 70)
 
-        # Cleanup (optional)
-        if config.cleanup_artifacts:
+        # Cleanup (optional); upload_source_code streams to COS and returns no local
+        # path, so this only applies to uploaders that stage an archive on disk
+        if config.cleanup_artifacts and zip_path:
             print(f"\nCleaning up local artifact: {zip_path}")
             Path(zip_path).unlink(missing_ok=True)
 
@@ -1,12 +1,98 @@
 """Configuration parser and validator for IBMCloudVercel."""
 
+import hashlib
 import os
-from dataclasses import dataclass
+import pickle
+import string
+import tempfile
+from dataclasses import dataclass, fields
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CACHE_PREFIX = "icv-cfg-"
+
+# Marks constructor arguments that were not passed, so an explicit None is kept
+_UNSET: Any = object()
+
+_REQUIRED_IBM_FIELDS = frozenset({"region", "project_id", "cos_bucket"})
+_ALLOWED_IBM_FIELDS = _REQUIRED_IBM_FIELDS | {
+    "cos_endpoint",
+    "registry_secret",
+    "trusted_profile_id",
+}
+
+# Bytes stripped from branch names when building Code Engine app names
+_APP_NAME_ALLOWED = (string.ascii_lowercase + string.digits + "-").encode("ascii")
+_APP_NAME_DISALLOWED_BYTES = bytes(b for b in range(256) if b not in _APP_NAME_ALLOWED)
+
+
+def _config_cache_path(config_file: Path) -> Path:
+    """Build the parse-cache location for a config file from its resolved path."""
+    key = hashlib.blake2b(str(config_file.resolve()).encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / f"{_CACHE_PREFIX}{key}.pkl"
+
+
+def _read_config_cache(cache_path: Path, stamp: tuple[int, int]) -> Any:
+    """Return the cached parse result for ``stamp``, or raise LookupError on a miss."""
+    try:
+        with open(cache_path, "rb") as f:
+            # Only trust cache entries written by the current user
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                raise LookupError(cache_path)
+            cached_stamp, data = pickle.load(f)
+    except Exception as e:
+        # Missing, unreadable or corrupt entries (unpickling can raise almost anything)
+        raise LookupError(cache_path) from e
+
+    # The config changed since it was cached; the next write overwrites this entry
+    if cached_stamp != stamp:
+        raise LookupError(cache_path)
+    return data
+
+
+def _write_config_cache(cache_path: Path, stamp: tuple[int, int], data: Any) -> None:
+    """Atomically store a parse result; failures are ignored since the cache is optional."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=_CACHE_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _load_yaml(config_file: Path) -> Any:
+    """
+    Parse a YAML config file, reusing a cached result while the file is unchanged.
+
+    The parsed document is pickled to the temp directory under a name derived from
+    the file's path, together with its (mtime_ns, size); a stamp mismatch is a
+    miss, so warm runs skip YAML parsing and edits replace the same cache entry.
+    """
+    st = config_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = _config_cache_path(config_file)
+    try:
+        return _read_config_cache(cache_path, stamp)
+    except LookupError:
+        pass
+
+    # Prefer the LibYAML-backed loader when available; reading bytes lets it
+    # scan the stream directly without a Python-level decode pass.
+    with open(config_file, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    _write_config_cache(cache_path, stamp, data)
+    return data
+
 
 @dataclass
 class ScalingConfig:
@@ -20,6 +106,9 @@ class ScalingConfig:
     concurrency: int = 100
 
 
+_SCALING_FIELDS = frozenset(f.name for f in fields(ScalingConfig))
+
+
 @dataclass
 class IBMCloudConfig:
     """IBM Cloud configuration and credentials."""
@@ -38,70 +127,208 @@ class IBMCloudConfig:
             self.cos_endpoint = f"s3.{self.region}.cloud-object-storage.appdomain.cloud"
 
 
-@dataclass
 class VercelConfig:
-    """Vercel-specific configuration and environment variables."""
+    """
+    Vercel-specific configuration and environment variables.
 
-    git_commit_sha: str
-    git_commit_ref: str
-    deployment_id: str
-    project_name: str
-    checks_token: Optional[str] = None
+    Each setting is read from the environment on first access; values passed
+    to the constructor (including an explicit ``checks_token=None``) take
+    precedence over the environment.
+    """
+
+    def __init__(
+        self,
+        git_commit_sha: str = _UNSET,
+        git_commit_ref: str = _UNSET,
+        deployment_id: str = _UNSET,
+        project_name: str = _UNSET,
+        checks_token: Optional[str] = _UNSET,
+    ) -> None:
+        overrides = {
+            "git_commit_sha": git_commit_sha,
+            "git_commit_ref": git_commit_ref,
+            "deployment_id": deployment_id,
+            "project_name": project_name,
+            "checks_token": checks_token,
+        }
+        # Pre-seed cached_property slots so explicit values skip the env lookup
+        self.__dict__.update((k, v) for k, v in overrides.items() if v is not _UNSET)
 
     @classmethod
     def from_environment(cls) -> "VercelConfig":
         """Load Vercel configuration from environment variables."""
-        git_commit_sha = os.getenv("VERCEL_GIT_COMMIT_SHA", "unknown")
-        git_commit_ref = os.getenv("VERCEL_GIT_COMMIT_REF", "main")
-        deployment_id = os.getenv("VERCEL_DEPLOYMENT_ID", "local")
-        project_name = os.getenv("VERCEL_PROJECT_NAME", "app")
-        checks_token = os.getenv("VERCEL_CHECKS_TOKEN")
-
-        return cls(
-            git_commit_sha=git_commit_sha,
-            git_commit_ref=git_commit_ref,
-            deployment_id=deployment_id,
-            project_name=project_name,
-            checks_token=checks_token,
+        return cls()
+
+    @cached_property
+    def git_commit_sha(self) -> str:
+        """Git commit SHA being deployed (VERCEL_GIT_COMMIT_SHA)."""
+        return os.getenv("VERCEL_GIT_COMMIT_SHA", "unknown")
+
+    @cached_property
+    def git_commit_ref(self) -> str:
+        """Git branch or ref being deployed (VERCEL_GIT_COMMIT_REF)."""
+        return os.getenv("VERCEL_GIT_COMMIT_REF", "main")
+
+    @cached_property
+    def deployment_id(self) -> str:
+        """Vercel deployment identifier (VERCEL_DEPLOYMENT_ID)."""
+        return os.getenv("VERCEL_DEPLOYMENT_ID", "local")
+
+    @cached_property
+    def project_name(self) -> str:
+        """Vercel project name (VERCEL_PROJECT_NAME)."""
+        return os.getenv("VERCEL_PROJECT_NAME", "app")
+
+    @cached_property
+    def checks_token(self) -> Optional[str]:
+        """Token for the Vercel Checks API, if set (VERCEL_CHECKS_TOKEN)."""
+        return os.getenv("VERCEL_CHECKS_TOKEN")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VercelConfig):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _VERCEL_FIELDS)
+
+    # Compared by value and mutable, so unhashable like the dataclass it replaced
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        # The checks token is a secret, so it is left out
+        return (
+            f"VercelConfig(git_commit_sha={self.git_commit_sha!r}, "
+            f"git_commit_ref={self.git_commit_ref!r}, deployment_id={self.deployment_id!r}, "
+            f"project_name={self.project_name!r})"
         )
 
     def get_app_name(self) -> str:
         """Generate a Code Engine app name based on the git branch."""
+        return self._app_name
+
+    @cached_property
+    def _app_name(self) -> str:
+        """Sanitized app name, computed once per config."""
         # Sanitize branch name for Code Engine (lowercase, alphanumeric + hyphens)
         sanitized_ref = self.git_commit_ref.lower().replace("/", "-").replace("_", "-")
-        # Remove any non-alphanumeric characters except hyphens
-        sanitized_ref = "".join(c for c in sanitized_ref if c.isalnum() or c == "-")
+        # Remove any non-alphanumeric characters except hyphens (non-ASCII is dropped)
+        sanitized_ref = (
+            sanitized_ref.encode("ascii", "ignore")
+            .translate(None, _APP_NAME_DISALLOWED_BYTES)
+            .decode("ascii")
+        )
         # Ensure it starts with a letter
-        if not sanitized_ref[0].isalpha():
+        if not sanitized_ref or not sanitized_ref[0].isalpha():
             sanitized_ref = "app-" + sanitized_ref
 
         return f"{self.project_name}-{sanitized_ref}"[:63]  # Code Engine name limit
 
 
+_VERCEL_FIELDS = (
+    "git_commit_sha",
+    "git_commit_ref",
+    "deployment_id",
+    "project_name",
+    "checks_token",
+)
+
+
 @dataclass
 class DeploymentConfig:
-    """Complete deployment configuration combining all settings."""
+    """
+    Complete deployment configuration combining all settings.
+
+    Sections are built from the raw YAML mapping on first access, so runs that
+    never touch a section (e.g. scaling during a COS-only upload) skip its
+    construction and validation.
+    """
 
-    ibm_cloud: IBMCloudConfig
-    scaling: ScalingConfig
+    data: dict[str, Any]
     vercel: VercelConfig
-    source_dir: str = "."
-    cleanup_artifacts: bool = True
+
+    @cached_property
+    def ibm_cloud(self) -> IBMCloudConfig:
+        """
+        IBM Cloud settings from the 'ibm_cloud' section.
+
+        Raises:
+            ValueError: If the section or any required field is missing, or if
+                the section contains unknown fields
+        """
+        # Validate required sections
+        if "ibm_cloud" not in self.data:
+            raise ValueError("Missing required 'ibm_cloud' section in configuration")
+
+        ibm_config_data = self.data["ibm_cloud"]
+        missing_fields = _REQUIRED_IBM_FIELDS.difference(ibm_config_data)
+
+        if missing_fields:
+            raise ValueError(
+                "Missing required fields in 'ibm_cloud' section: "
+                f"{', '.join(sorted(missing_fields))}"
+            )
+
+        # Catch typos early instead of silently ignoring them
+        unknown_fields = ibm_config_data.keys() - _ALLOWED_IBM_FIELDS
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields in 'ibm_cloud' section: {', '.join(sorted(unknown_fields))}"
+            )
+
+        return IBMCloudConfig(
+            region=ibm_config_data["region"],
+            project_id=ibm_config_data["project_id"],
+            cos_bucket=ibm_config_data["cos_bucket"],
+            cos_endpoint=ibm_config_data.get("cos_endpoint"),
+            registry_secret=ibm_config_data.get("registry_secret"),
+            trusted_profile_id=ibm_config_data.get("trusted_profile_id"),
+        )
+
+    @cached_property
+    def scaling(self) -> ScalingConfig:
+        """
+        Scaling settings (optional section, uses defaults if not provided).
+
+        Raises:
+            ValueError: If the section contains unknown fields
+        """
+        scaling_data = self.data.get("scaling") or {}
+        if not scaling_data:
+            return ScalingConfig()
+
+        unknown_fields = scaling_data.keys() - _SCALING_FIELDS
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields in 'scaling' section: {', '.join(sorted(unknown_fields))}"
+            )
+
+        # The dataclass field defaults fill in anything the section omits
+        return ScalingConfig(**scaling_data)
+
+    @property
+    def source_dir(self) -> str:
+        """Directory containing source code to deploy."""
+        return str(self.data.get("source_dir", "."))
+
+    @property
+    def cleanup_artifacts(self) -> bool:
+        """Whether to clean up deployment artifacts after a successful run."""
+        return bool(self.data.get("cleanup_artifacts", True))
 
     @classmethod
     def from_yaml(cls, config_path: str = "ibmcloudvercel.yml") -> "DeploymentConfig":
         """
-        Load and validate configuration from YAML file.
+        Load configuration from YAML file.
+
+        Section validation is deferred until the section is first accessed.
 
         Args:
             config_path: Path to the configuration YAML file
 
         Returns:
-            DeploymentConfig instance with validated settings
+            DeploymentConfig instance backed by the parsed YAML
 
         Raises:
             FileNotFoundError: If config file doesn't exist
-            ValueError: If required fields are missing or invalid
+            ValueError: If the config file is empty
         """
         config_file = Path(config_path)
 
@@ -111,60 +338,15 @@ class DeploymentConfig:
                 "Create an ibmcloudvercel.yml file in your project root."
             )
 
-        with open(config_file, "r") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(config_file)
 
         if not data:
             raise ValueError(f"Configuration file is empty: {config_path}")
 
-        # Validate required sections
-        if "ibm_cloud" not in data:
-            raise ValueError("Missing required 'ibm_cloud' section in configuration")
-
-        # Parse IBM Cloud config
-        ibm_config_data = data["ibm_cloud"]
-        required_fields = ["region", "project_id", "cos_bucket"]
-        missing_fields = [f for f in required_fields if f not in ibm_config_data]
-
-        if missing_fields:
-            raise ValueError(
-                f"Missing required fields in 'ibm_cloud' section: {', '.join(missing_fields)}"
-            )
-
-        ibm_cloud = IBMCloudConfig(
-            region=ibm_config_data["region"],
-            project_id=ibm_config_data["project_id"],
-            cos_bucket=ibm_config_data["cos_bucket"],
-            cos_endpoint=ibm_config_data.get("cos_endpoint"),
-            registry_secret=ibm_config_data.get("registry_secret"),
-            trusted_profile_id=ibm_config_data.get("trusted_profile_id"),
-        )
-
-        # Parse scaling config (optional, uses defaults if not provided)
-        scaling_data = data.get("scaling", {})
-        scaling = ScalingConfig(
-            min_scale=scaling_data.get("min_scale", 0),
-            max_scale=scaling_data.get("max_scale", 10),
-            cpu=scaling_data.get("cpu", "0.25"),
-            memory=scaling_data.get("memory", "0.5G"),
-            port=scaling_data.get("port", 8080),
-            concurrency=scaling_data.get("concurrency", 100),
-        )
-
         # Load Vercel config from environment
         vercel = VercelConfig.from_environment()
 
-        # Parse deployment options
-        source_dir = data.get("source_dir", ".")
-        cleanup_artifacts = data.get("cleanup_artifacts", True)
-
-        return cls(
-            ibm_cloud=ibm_cloud,
-            scaling=scaling,
-            vercel=vercel,
-            source_dir=source_dir,
-            cleanup_artifacts=cleanup_artifacts,
-        )
+        return cls(data=data, vercel=vercel)
 
 
 def load_config(config_path: str = "ibmcloudvercel.yml") -> DeploymentConfig:
@@ -2,14 +2,51 @@
 
 from __future__ import annotations
 
+import atexit
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 VERCEL_API_BASE = "https://api.vercel.com"
 CHECK_NAME = "ibm-cloud-vercel"
 
+# Check start and completion share one keep-alive connection to the Vercel API.
+# Each POST creates a check, so only retry when Vercel cannot have processed it:
+# connection failures and 429s. Read timeouts, other mid-response errors and 5xx
+# responses are never retried, since they could duplicate the check.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2,
+            read=False,
+            other=0,
+            backoff_factor=0.2,
+            status_forcelist=[429],
+            # 429 is only retried for methods listed here
+            allowed_methods=frozenset({"POST"}),
+            # Don't let a long Retry-After stall the exit-time flush
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
+# (connect, read) timeouts; a short connect timeout keeps connection retries cheap
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Check updates are sent off the main thread so deployment work overlaps the
+# API round trip. A single worker keeps updates in submission order, so a
+# completion can never land before its start; pending updates are flushed at exit.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vercel-checks")
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
 
 def _get_checks_token(token: Optional[str] = None) -> Optional[str]:
     """Resolve the Vercel checks token from the caller or environment."""
@@ -29,18 +66,35 @@ def _post_check_update(
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = _SESSION.post(url, headers=headers, json=payload, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as exc:
         print(f"  ⚠️  Failed to update Vercel check: {exc}")
 
 
+def _report_background_failure(future: Future[None]) -> None:
+    """Surface errors from fire-and-forget updates that nobody waits on."""
+    exc = future.exception()
+    if exc is not None:
+        print(f"  ⚠️  Failed to update Vercel check: {exc!r}")
+
+
+def _submit_in_background(deployment_id: str, payload: dict, token: str) -> None:
+    """Queue a check update without waiting for it."""
+    future = _EXECUTOR.submit(_post_check_update, deployment_id, payload, token)
+    future.add_done_callback(_report_background_failure)
+
+
 def start_deployment_check(
     deployment_id: Optional[str],
     token: Optional[str] = None,
     summary: str | None = None,
 ) -> None:
-    """Create an in-progress deployment check in Vercel."""
+    """
+    Create an in-progress deployment check in Vercel.
+
+    The update is sent in the background; this returns without waiting for it.
+    """
     if not deployment_id:
         print("  ⚠️  Missing Vercel deployment ID; skipping check start.")
         return
@@ -66,7 +120,7 @@ def start_deployment_check(
         ]
     }
 
-    _post_check_update(deployment_id, payload, resolved_token)
+    _submit_in_background(deployment_id, payload, resolved_token)
 
 
 def complete_deployment_check(
@@ -77,7 +131,13 @@ def complete_deployment_check(
     url: Optional[str] = None,
     error: Optional[str] = None,
 ) -> None:
-    """Complete the deployment check with a final status."""
+    """
+    Complete the deployment check with a final status.
+
+    Successful completions are sent in the background. Failures block until the
+    update (and any earlier pending update) has been sent, since the caller is
+    usually about to exit with an error.
+    """
     if not deployment_id:
         print("  ⚠️  Missing Vercel deployment ID; skipping check completion.")
         return
@@ -108,4 +168,7 @@ def complete_deployment_check(
         ]
     }
 
-    _post_check_update(deployment_id, payload, resolved_token)
+    if status == "succeeded":
+        _submit_in_background(deployment_id, payload, resolved_token)
+    else:
+        _EXECUTOR.submit(_post_check_update, deployment_id, payload, resolved_token).result()
@@ -4,11 +4,40 @@ This module provides centralized authentication for all IBM Cloud SDK clients.
 Supports both API key authentication and OIDC token exchange via IBM Trusted Profiles.
 """
 
+import hashlib
 import os
+import string
+import time
 from typing import Optional, Union
 
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator, BearerTokenAuthenticator
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Reused for IAM token exchanges so each call skips a fresh TLS handshake;
+# rate-limited or 5xx responses from IAM are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        ),
+    ),
+)
+
+# Exchanged IAM tokens keyed by (sha256 of OIDC token, profile ID, IAM endpoint),
+# stored with the monotonic time at which they expire
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[float, BearerTokenAuthenticator]] = {}
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+_API_KEY_ALLOWED_BYTES = (string.ascii_letters + string.digits + "-_").encode("ascii")
 
 
 def create_iam_authenticator(api_key: Optional[str] = None) -> IAMAuthenticator:
@@ -78,8 +107,9 @@ def validate_api_key(api_key: str) -> bool:
         True if the API key appears valid, False otherwise
 
     Note:
-        This only checks basic format, not whether the key is actually valid
-        with IBM Cloud. Actual validation happens when making API calls.
+        This only checks basic format (length and the [A-Za-z0-9_-] character set),
+        not whether the key is actually valid with IBM Cloud. Actual validation
+        happens when making API calls.
     """
     if not api_key:
         return False
@@ -89,7 +119,10 @@ def validate_api_key(api_key: str) -> bool:
     if len(api_key) < 20:
         return False
 
-    return True
+    # Deleting every allowed byte leaves nothing behind for a well-formed key
+    if not api_key.isascii():
+        return False
+    return not api_key.encode("ascii").translate(None, _API_KEY_ALLOWED_BYTES)
 
 
 def create_iam_authenticator_oidc(
@@ -122,6 +155,11 @@ def create_iam_authenticator_oidc(
         >>> oidc_token = os.getenv("VERCEL_OIDC_TOKEN")
         >>> profile_id = "Profile-xxxxx-xxxx-xxxx"
         >>> auth = create_iam_authenticator_oidc(oidc_token, profile_id)
+
+    Note:
+        Successful exchanges are cached in-process until shortly before the IAM
+        token expires, so repeated calls with the same OIDC token and profile
+        reuse the existing authenticator.
     """
     if not oidc_token:
         raise ValueError("OIDC token is required for OIDC authentication")
@@ -132,6 +170,15 @@ def create_iam_authenticator_oidc(
             "Set it in your ibmcloudvercel.yml configuration."
         )
 
+    cache_key = (
+        hashlib.sha256(oidc_token.encode()).hexdigest(),
+        trusted_profile_id,
+        iam_endpoint,
+    )
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() < cached[0] - _TOKEN_EXPIRY_MARGIN_SECONDS:
+        return cached[1]
+
     # Exchange OIDC token for IBM IAM access token
     try:
         # IBM Cloud IAM token exchange endpoint
@@ -150,7 +197,8 @@ def create_iam_authenticator_oidc(
         }
 
         # Make the token exchange request
-        response = requests.post(token_url, headers=headers, data=data, timeout=10)
+        requested_at = time.monotonic()
+        response = _SESSION.post(token_url, headers=headers, data=data, timeout=10)
         response.raise_for_status()
 
         # Extract the access token
@@ -164,7 +212,14 @@ def create_iam_authenticator_oidc(
         print(f"    Token expires in: {token_data.get('expires_in', 'unknown')} seconds")
 
         # Create and return a BearerTokenAuthenticator
-        return BearerTokenAuthenticator(bearer_token=access_token)
+        authenticator = BearerTokenAuthenticator(bearer_token=access_token)
+
+        # Only cache when IAM tells us how long the token is valid
+        expires_in = token_data.get("expires_in")
+        if isinstance(expires_in, (int, float)):
+            _TOKEN_CACHE[cache_key] = (requested_at + expires_in, authenticator)
+
+        return authenticator
 
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Failed to exchange OIDC token with IBM IAM: {str(e)}") from e
@@ -1,11 +1,18 @@
 """IBM Cloud Object Storage (COS) SDK wrapper for source code upload."""
 
+import base64
+import fnmatch
+import hashlib
+import mmap
 import os
+import re
+import threading
+import time
 import zipfile
-from datetime import datetime
-from fnmatch import fnmatch
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Iterator, Optional, Union
 
 import ibm_boto3
 from ibm_botocore.client import Config
@@ -39,6 +46,308 @@ DEFAULT_EXCLUDE_PATTERNS = [
     "coverage",
 ]
 
+_GLOB_TOKENS = ("*", "?", "[", "]")
+
+# Files up to this size are read ahead by worker threads while the main thread
+# compresses; larger files are streamed by ZipFile.write to bound memory use.
+_READAHEAD_MAX_BYTES = 4 * 1024 * 1024
+_READAHEAD_WORKERS = min(8, os.cpu_count() or 1)
+# Files above this size are memory-mapped rather than copied into a bytes object
+_MMAP_MIN_BYTES = 64 * 1024
+
+# The archive is uploaded once and discarded, so favour deflate speed over ratio
+_ARCHIVE_COMPRESSLEVEL = 1
+
+# Part size for streamed multipart uploads (S3 requires >= 5 MiB for all but the last part)
+_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+# Concurrent part uploads for streamed archives; matches ibm_boto3's default
+# TransferConfig (max_request_concurrency=10) used by upload_fileobj
+_UPLOAD_MAX_CONCURRENCY = 10
+
+_ArchiveMember = tuple[zipfile.ZipInfo, Optional[Union[bytes, mmap.mmap]]]
+
+
+def _compile_exclude_patterns(
+    patterns: list[str],
+) -> tuple[frozenset[str], Optional[re.Pattern[str]]]:
+    """
+    Split exclude patterns into base-name tokens and a single compiled glob regex.
+
+    Patterns without globbing tokens exclude any path containing that exact
+    directory/file name; the rest are combined into one alternation so each path
+    is matched in a single regex pass.
+
+    Returns:
+        Tuple of (base-name set, compiled glob regex or None if there are no globs)
+    """
+    basenames = frozenset(p for p in patterns if not any(t in p for t in _GLOB_TOKENS))
+    globs = [p for p in patterns if p not in basenames]
+    glob_regex = re.compile("|".join(fnmatch.translate(p) for p in globs)) if globs else None
+    return basenames, glob_regex
+
+
+# The defaults never change, so split and compile them once at import
+_DEFAULT_BASENAMES, _DEFAULT_GLOB_RE = _compile_exclude_patterns(DEFAULT_EXCLUDE_PATTERNS)
+
+
+def _read_archive_member(path: str, arcname: str, use_mmap: bool) -> _ArchiveMember:
+    """
+    Stat a file for the archive and load its contents if it is small enough.
+
+    With ``use_mmap``, medium-sized files are memory-mapped so CRC32 and deflate
+    read the page cache directly instead of a user-space copy; the caller must
+    close the mapping. A file truncated while mapped raises SIGBUS on access,
+    which kills the process without running any cleanup, so only enable this
+    where no such cleanup is needed.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    if zinfo.file_size > _READAHEAD_MAX_BYTES:
+        return zinfo, None
+    with open(path, "rb") as f:
+        # Size the mapping from the open fd; the file may have changed since the stat
+        size = os.fstat(f.fileno()).st_size
+        if size > _READAHEAD_MAX_BYTES:
+            return zinfo, None
+        if not use_mmap or size <= _MMAP_MIN_BYTES:
+            return zinfo, f.read()
+        data = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    # Start paging the file in now so the read still overlaps compression
+    if hasattr(mmap, "MADV_WILLNEED"):
+        data.madvise(mmap.MADV_WILLNEED)
+    return zinfo, data
+
+
+def _iter_source_files(
+    root: Path,
+    excluded_names: frozenset[str],
+) -> Iterator[tuple["os.DirEntry[str]", str]]:
+    """
+    Walk a source tree, yielding regular files with their POSIX-style relative path.
+
+    Entries whose name is in ``excluded_names`` are skipped before any path is
+    built for them; excluded directories are pruned before descending, so large
+    subtrees (node_modules, .git, ...) are never listed. Uses ``os.scandir`` so
+    file-type checks come from the cached directory entry. Directories that
+    cannot be listed for lack of permission are skipped rather than failing.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except PermissionError:
+            # Unreadable directories are skipped, as Path.rglob did before
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name in excluded_names:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{rel_prefix}{name}/"))
+                elif entry.is_file():
+                    yield entry, rel_prefix + name
+
+
+def _resolve_source_dir(source_dir: Union[str, Path]) -> Path:
+    """
+    Resolve the directory to archive.
+
+    Raises:
+        FileNotFoundError: If the source directory doesn't exist
+    """
+    source_path = Path(source_dir).resolve()
+
+    if not source_path.exists():
+        raise FileNotFoundError(f"Source directory not found: {source_dir}")
+
+    return source_path
+
+
+def _write_source_archive(
+    target: Union[Path, "_MultipartUploadStream"],
+    source_dir: Union[str, Path],
+    exclude_patterns: Optional[list[str]] = None,
+) -> None:
+    """
+    Write a zip archive of the source directory to a path or writable stream.
+
+    Args:
+        target: Output file path, or a write-only stream (written without seeking)
+        source_dir: Directory to zip
+        exclude_patterns: List of patterns to exclude (defaults to DEFAULT_EXCLUDE_PATTERNS)
+
+    Raises:
+        FileNotFoundError: If the source directory doesn't exist
+    """
+    source_path = _resolve_source_dir(source_dir)
+
+    if exclude_patterns is None:
+        basename_set, glob_regex = _DEFAULT_BASENAMES, _DEFAULT_GLOB_RE
+    else:
+        basename_set, glob_regex = _compile_exclude_patterns(exclude_patterns)
+
+    def should_exclude(name: str, relative_path: str) -> bool:
+        """Check if file should be excluded based on glob rules."""
+        # Base-name rules are applied by the walk itself, so only globs are left;
+        # match both the filename and relative path
+        if glob_regex is None:
+            return False
+        return bool(glob_regex.match(name) or glob_regex.match(relative_path))
+
+    def write_member(zipf: zipfile.ZipFile, future: "Future[_ArchiveMember]", path: str) -> None:
+        """Add a read-ahead result to the archive, streaming files that were too large."""
+        zinfo, data = future.result()
+        if data is None:
+            zipf.write(path, zinfo.filename)
+            return
+        try:
+            zipf.writestr(
+                zinfo,
+                data,
+                compress_type=zipf.compression,
+                compresslevel=zipf.compresslevel,
+            )
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    # A SIGBUS from a mapped file would skip aborting a streamed multipart upload,
+    # so only map files when writing a local archive
+    use_mmap = isinstance(target, Path)
+
+    # Create the zip archive; file reads overlap with compression via a bounded window
+    with ThreadPoolExecutor(max_workers=_READAHEAD_WORKERS) as pool:
+        with zipfile.ZipFile(
+            target, "w", zipfile.ZIP_DEFLATED, compresslevel=_ARCHIVE_COMPRESSLEVEL
+        ) as zipf:
+            pending: deque[tuple[Future[_ArchiveMember], str]] = deque()
+            for entry, arcname in _iter_source_files(source_path, basename_set):
+                if should_exclude(entry.name, arcname):
+                    continue
+                future = pool.submit(_read_archive_member, entry.path, arcname, use_mmap)
+                pending.append((future, entry.path))
+                if len(pending) > _READAHEAD_WORKERS * 2:
+                    write_member(zipf, *pending.popleft())
+            while pending:
+                write_member(zipf, *pending.popleft())
+
+
+class _MultipartUploadStream:
+    """
+    Write-only stream that uploads its contents to COS as a multipart upload.
+
+    Bytes are buffered into parts of ``part_size``; each full part is handed to a
+    pool of ``max_concurrency`` upload threads, so callers can stream an archive
+    straight to COS without staging it on disk or waiting on every round trip.
+    At most ``max_concurrency`` parts are in flight at once; further writes block
+    until one finishes. The stream has no ``seek``, which makes zipfile write
+    data descriptors instead of rewinding to patch local headers.
+
+    Each part carries a Content-MD5 header so COS rejects corrupted parts, and a
+    SHA-256 of the whole object is accumulated as parts are queued.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket_name: str,
+        object_name: str,
+        part_size: int,
+        max_concurrency: int,
+    ) -> None:
+        self._client = client
+        self._bucket_name = bucket_name
+        self._object_name = object_name
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._part_count = 0
+        self._sha256 = hashlib.sha256()
+        self._futures: list[Future[dict[str, Any]]] = []
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        response = client.create_multipart_upload(Bucket=bucket_name, Key=object_name)
+        self._upload_id = response["UploadId"]
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def write(self, data: bytes) -> int:
+        """Buffer data, queueing every full part for upload."""
+        view = memoryview(data)
+        self._buffer += view
+        self._position += view.nbytes
+        while len(self._buffer) >= self._part_size:
+            self._queue_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return view.nbytes
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._position
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the bytes queued so far (the full object after ``complete``)."""
+        return self._sha256.hexdigest()
+
+    def flush(self) -> None:
+        """No-op; parts are only sent once full so every part but the last meets the S3 minimum."""
+
+    def close(self) -> None:
+        """No-op; the upload is finished explicitly with ``complete`` or ``abort``."""
+
+    def complete(self) -> None:
+        """Upload the remaining buffered bytes as the last part and finish the upload."""
+        if self._buffer or not self._part_count:
+            self._queue_part(bytes(self._buffer))
+            self._buffer.clear()
+        parts = [future.result() for future in self._futures]
+        self._pool.shutdown()
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=self._object_name,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])},
+        )
+
+    def abort(self) -> None:
+        """Stop uploading and abort the upload so COS discards any parts already sent."""
+        # Drop queued parts and wait for running ones so none land after the abort
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=self._object_name,
+                UploadId=self._upload_id,
+            )
+        except Exception as e:
+            print(f"Warning: Failed to abort multipart upload: {str(e)}")
+
+    def _queue_part(self, body: bytes) -> None:
+        # Backpressure: wait for a free upload slot before buffering another part
+        self._slots.acquire()
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                self._slots.release()
+                future.result()  # re-raise the failed part's error
+
+        self._part_count += 1
+        self._sha256.update(body)
+        future = self._pool.submit(self._upload_part, self._part_count, body)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict[str, Any]:
+        content_md5 = hashlib.md5(body, usedforsecurity=False).digest()
+        response = self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._object_name,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+            ContentMD5=base64.b64encode(content_md5).decode("ascii"),
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
 
 class COSUploader:
     """Handles zipping and uploading source code to IBM Cloud Object Storage."""
@@ -105,48 +414,15 @@ class COSUploader:
         Returns:
             Path to the created zip file
         """
-        if exclude_patterns is None:
-            exclude_patterns = DEFAULT_EXCLUDE_PATTERNS.copy()
-
-        source_path = Path(source_dir).resolve()
-
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source directory not found: {source_dir}")
-
         # Generate output path if not provided
         if output_path is None:
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
             output_path = f"/tmp/source_{timestamp}.zip"
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        def should_exclude(file_path: Path) -> bool:
-            """Check if file should be excluded based on glob/base-name rules."""
-            relative_path = file_path.relative_to(source_path)
-            relative_str = relative_path.as_posix()
-            parts = relative_path.parts
-
-            for pattern in exclude_patterns:
-                # Base-name pattern: treat as directory/file name exclusion if no globbing tokens
-                has_glob = any(token in pattern for token in ("*", "?", "[", "]"))
-                if not has_glob:
-                    if pattern in parts:
-                        return True
-                    continue
-
-                # Glob-aware checks (match both the filename and relative path)
-                if fnmatch(file_path.name, pattern) or fnmatch(relative_str, pattern):
-                    return True
-
-            return False
-
-        # Create the zip archive
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for item in source_path.rglob("*"):
-                if item.is_file() and not should_exclude(item):
-                    arcname = item.relative_to(source_path)
-                    zipf.write(item, arcname)
+        _write_source_archive(output_file, source_dir, exclude_patterns)
 
         file_size = output_file.stat().st_size
         print(f"Created source archive: {output_file} ({file_size / 1024 / 1024:.2f} MB)")
@@ -215,36 +491,68 @@ class COSUploader:
         source_dir: str,
         deployment_id: str,
         exclude_patterns: Optional[list[str]] = None,
-    ) -> tuple[str, str]:
+    ) -> tuple[str, Optional[str]]:
         """
         Complete workflow: zip source code and upload to COS.
 
+        The archive is streamed to COS as a multipart upload while it is being
+        written, so no local zip file is created.
+
         Args:
             source_dir: Directory containing source code
             deployment_id: Unique deployment identifier (used in filename)
             exclude_patterns: Optional list of patterns to exclude from zip
 
         Returns:
-            Tuple of (COS URI, local zip file path)
+            Tuple of (COS URI, local zip file path); the path is always None
+            since nothing is staged on disk
+
+        Raises:
+            FileNotFoundError: If the source directory doesn't exist
+            RuntimeError: If the upload fails
         """
         # Create unique object name
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         object_name = f"deployments/{deployment_id}/{timestamp}_source.zip"
 
-        # Create archive
-        print(f"Creating source archive from {source_dir}...")
-        zip_path = self.create_source_archive(
-            source_dir=source_dir,
-            exclude_patterns=exclude_patterns,
+        print(
+            f"Streaming source archive from {source_dir} to COS bucket "
+            f"'{self.bucket_name}' as '{object_name}'..."
         )
 
-        # Upload to COS
-        cos_uri = self.upload_file(
-            file_path=zip_path,
-            object_name=object_name,
-        )
+        # Fail before touching COS so a bad path doesn't create (and abort) an upload
+        source_path = _resolve_source_dir(source_dir)
+
+        try:
+            stream = _MultipartUploadStream(
+                self.client,
+                self.bucket_name,
+                object_name,
+                _MULTIPART_PART_SIZE,
+                _UPLOAD_MAX_CONCURRENCY,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload file to COS: {str(e)}") from e
+
+        # Abort on any exit without completion, including KeyboardInterrupt and
+        # SystemExit, so no billable orphaned parts are left behind
+        completed = False
+        try:
+            _write_source_archive(stream, source_path, exclude_patterns)
+            stream.complete()
+            completed = True
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload file to COS: {str(e)}") from e
+        finally:
+            if not completed:
+                stream.abort()
+
+        print(f"Upload successful: {object_name} ({stream.tell() / 1024 / 1024:.2f} MB)")
+        print(f"  SHA-256: {stream.sha256}")
 
-        return cos_uri, zip_path
+        # Return COS URI
+        cos_uri = f"cos://{self.bucket_name}/{object_name}"
+        return cos_uri, None
 
 
 def create_cos_uploader(
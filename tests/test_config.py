@@ -0,0 +1,84 @@
+"""Tests for configuration loading and the parsed-YAML cache."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ibm_cloud_vercel.core import config
+
+CONFIG_YAML = """\
+ibm_cloud:
+  region: us-south
+  project_id: proj
+  cos_bucket: bucket
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config cache at an isolated temp directory."""
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "ibmcloudvercel.yml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+def test_cache_hit_skips_yaml_parsing(
+    cache_dir: Path, config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = config.load_config(str(config_file))
+    assert first.ibm_cloud.region == "us-south"
+
+    def fail_load(*args: object, **kwargs: object) -> None:
+        raise AssertionError("YAML should not be parsed on a cache hit")
+
+    monkeypatch.setattr(config.yaml, "load", fail_load)
+    second = config.load_config(str(config_file))
+
+    assert second.data == first.data
+
+
+def test_cache_miss_after_edit_overwrites_entry(cache_dir: Path, config_file: Path) -> None:
+    config.load_config(str(config_file))
+    assert len(list(cache_dir.glob("icv-cfg-*.pkl"))) == 1
+
+    config_file.write_text(CONFIG_YAML.replace("us-south", "eu-gb"))
+    st = config_file.stat()
+    # Make sure the stamp changes even on filesystems with coarse mtimes
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    reloaded = config.load_config(str(config_file))
+
+    assert reloaded.ibm_cloud.region == "eu-gb"
+    assert len(list(cache_dir.glob("icv-cfg-*.pkl"))) == 1
+
+
+def test_corrupt_cache_entry_is_a_miss(cache_dir: Path, config_file: Path) -> None:
+    config.load_config(str(config_file))
+    (cache_file,) = cache_dir.glob("icv-cfg-*.pkl")
+    cache_file.write_bytes(b"not a pickle")
+
+    assert config.load_config(str(config_file)).ibm_cloud.cos_bucket == "bucket"
+
+
+def test_vercel_config_keeps_explicit_none_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VERCEL_CHECKS_TOKEN", "from-env")
+
+    assert config.VercelConfig("sha", "main", "dpl", "app", checks_token=None).checks_token is None
+    assert config.VercelConfig("sha", "main", "dpl", "app").checks_token == "from-env"
+
+
+def test_vercel_config_compares_by_value() -> None:
+    a = config.VercelConfig("sha", "main", "dpl", "app", checks_token=None)
+
+    assert a == config.VercelConfig("sha", "main", "dpl", "app", checks_token=None)
+    assert a != config.VercelConfig("sha", "feature", "dpl", "app", checks_token=None)
@@ -0,0 +1,255 @@
+"""Tests for streaming source archives to COS."""
+
+import base64
+import hashlib
+import io
+import threading
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ibm_cloud_vercel.sdk import cos
+
+
+class FakeS3Client:
+    """Records multipart-upload calls made against it."""
+
+    def __init__(self, fail_part: int = 0) -> None:
+        self.fail_part = fail_part
+        self.created = 0
+        self.parts: dict[int, dict[str, Any]] = {}
+        self.completed: Any = None
+        self.aborted = False
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, **kwargs: Any) -> dict[str, str]:
+        self.created += 1
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs: Any) -> dict[str, str]:
+        if kwargs["PartNumber"] == self.fail_part:
+            raise ConnectionError("part upload failed")
+        with self._lock:
+            self.parts[kwargs["PartNumber"]] = kwargs
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs: Any) -> None:
+        self.completed = kwargs
+
+    def abort_multipart_upload(self, **kwargs: Any) -> None:
+        self.aborted = True
+
+    def uploaded_bytes(self) -> bytes:
+        return b"".join(self.parts[n]["Body"] for n in sorted(self.parts))
+
+
+def make_uploader(client: FakeS3Client) -> cos.COSUploader:
+    uploader = cos.COSUploader.__new__(cos.COSUploader)
+    uploader.client = client
+    uploader.bucket_name = "bucket"
+    return uploader
+
+
+def test_stream_splits_parts_and_sets_content_md5() -> None:
+    client = FakeS3Client()
+    stream = cos._MultipartUploadStream(client, "bucket", "key", part_size=4, max_concurrency=2)
+    payload = b"abcdefghij"
+
+    stream.write(payload[:3])
+    stream.write(payload[3:])
+    stream.complete()
+
+    assert [len(client.parts[n]["Body"]) for n in sorted(client.parts)] == [4, 4, 2]
+    for part in client.parts.values():
+        expected = base64.b64encode(hashlib.md5(part["Body"]).digest()).decode("ascii")
+        assert part["ContentMD5"] == expected
+    assert client.completed["MultipartUpload"]["Parts"] == [
+        {"ETag": "etag-1", "PartNumber": 1},
+        {"ETag": "etag-2", "PartNumber": 2},
+        {"ETag": "etag-3", "PartNumber": 3},
+    ]
+    assert client.uploaded_bytes() == payload
+    assert stream.tell() == len(payload)
+    assert stream.sha256 == hashlib.sha256(payload).hexdigest()
+
+
+def test_stream_surfaces_failed_part_and_aborts() -> None:
+    client = FakeS3Client(fail_part=2)
+    stream = cos._MultipartUploadStream(client, "bucket", "key", part_size=4, max_concurrency=1)
+
+    # The failure surfaces on the next queued part or on complete, whichever comes first
+    with pytest.raises(ConnectionError):
+        stream.write(b"x" * 12)
+        stream.complete()
+    stream.abort()
+
+    assert client.completed is None
+    assert client.aborted
+
+
+def test_upload_source_code_streams_a_valid_zip(tmp_path: Path) -> None:
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("x")
+    client = FakeS3Client()
+
+    cos_uri, zip_path = make_uploader(client).upload_source_code(str(tmp_path), "dpl")
+
+    assert cos_uri.startswith("cos://bucket/deployments/dpl/")
+    assert zip_path is None
+    archive = zipfile.ZipFile(io.BytesIO(client.uploaded_bytes()))
+    assert archive.namelist() == ["app.py"]
+
+
+def test_upload_source_code_does_not_mmap_source_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = b"x" * (cos._MMAP_MIN_BYTES * 2)
+    (tmp_path / "bundle.js").write_bytes(payload)
+
+    real_read = cos._read_archive_member
+    loaded: list[Any] = []
+
+    def record_read(path: str, arcname: str, use_mmap: bool) -> Any:
+        member = real_read(path, arcname, use_mmap)
+        loaded.append(member[1])
+        return member
+
+    monkeypatch.setattr(cos, "_read_archive_member", record_read)
+    client = FakeS3Client()
+
+    make_uploader(client).upload_source_code(str(tmp_path), "dpl")
+
+    assert [type(data) for data in loaded] == [bytes]
+    archive = zipfile.ZipFile(io.BytesIO(client.uploaded_bytes()))
+    assert archive.read("bundle.js") == payload
+
+
+def test_upload_source_code_checks_source_dir_before_uploading(tmp_path: Path) -> None:
+    client = FakeS3Client()
+
+    with pytest.raises(FileNotFoundError):
+        make_uploader(client).upload_source_code(str(tmp_path / "missing"), "dpl")
+
+    assert client.created == 0
+
+
+def test_upload_source_code_aborts_on_interrupt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def interrupt(*args: object, **kwargs: object) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(cos, "_write_source_archive", interrupt)
+    client = FakeS3Client()
+
+    with pytest.raises(KeyboardInterrupt):
+        make_uploader(client).upload_source_code(str(tmp_path), "dpl")
+
+    assert client.aborted
+    assert client.completed is None
+
+
+def test_read_archive_member_uses_size_of_open_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "bundle.js"
+    path.write_bytes(b"x" * (cos._MMAP_MIN_BYTES * 2))
+    real_from_file = zipfile.ZipInfo.from_file
+
+    def stat_then_truncate(filename: Any, arcname: Any = None, **kwargs: Any) -> zipfile.ZipInfo:
+        zinfo = real_from_file(filename, arcname, **kwargs)
+        path.write_bytes(b"")  # the file shrinks between the stat and the open
+        return zinfo
+
+    monkeypatch.setattr(zipfile.ZipInfo, "from_file", staticmethod(stat_then_truncate))
+
+    _, data = cos._read_archive_member(str(path), "bundle.js", use_mmap=True)
+
+    assert data == b""
+
+
+def make_source_tree(root: Path) -> None:
+    files = [
+        "app.py",
+        "app.pyc",
+        "debug.log",
+        "src/main.py",
+        "src/cache.pyc",
+        "src/node_modules/dep/index.js",
+        "node_modules/dep/index.js",
+        "pkg/.git/HEAD",
+        "e.log/inner/notes.txt",
+        "docs/readme.txt",
+    ]
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    (root / "link.py").symlink_to(root / "app.py")
+    (root / "linked_dir").symlink_to(root / "src", target_is_directory=True)
+
+
+@pytest.mark.parametrize(
+    ("exclude_patterns", "expected"),
+    [
+        (
+            None,
+            ["app.py", "docs/readme.txt", "e.log/inner/notes.txt", "link.py", "src/main.py"],
+        ),
+        (
+            [],
+            [
+                "app.py",
+                "app.pyc",
+                "debug.log",
+                "docs/readme.txt",
+                "e.log/inner/notes.txt",
+                "link.py",
+                "node_modules/dep/index.js",
+                "pkg/.git/HEAD",
+                "src/cache.pyc",
+                "src/main.py",
+                "src/node_modules/dep/index.js",
+            ],
+        ),
+        (
+            ["*.txt", "src", "node_modules"],
+            ["app.py", "app.pyc", "debug.log", "link.py", "pkg/.git/HEAD"],
+        ),
+    ],
+)
+def test_write_source_archive_members(
+    tmp_path: Path, exclude_patterns: Any, expected: list[str]
+) -> None:
+    source = tmp_path / "source"
+    make_source_tree(source)
+    output = tmp_path / "source.zip"
+
+    cos._write_source_archive(output, source, exclude_patterns)
+
+    assert sorted(zipfile.ZipFile(output).namelist()) == expected
+
+
+def test_write_source_archive_skips_unreadable_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source"
+    (source / "secret").mkdir(parents=True)
+    (source / "secret" / "key.txt").write_text("x")
+    (source / "a.txt").write_text("a")
+    real_scandir = cos.os.scandir
+
+    def deny_secret(path: Any) -> Any:
+        if Path(path).name == "secret":
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(cos.os, "scandir", deny_secret)
+    output = tmp_path / "source.zip"
+
+    cos._write_source_archive(output, source)
+
+    assert zipfile.ZipFile(output).namelist() == ["a.txt"]